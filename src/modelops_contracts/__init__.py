@@ -25,6 +25,7 @@ from .entrypoint import (
     EntrypointFormatError,
     format_entrypoint,
     parse_entrypoint,
+    resolve_entrypoint_cached,
 )
 from .errors import ContractViolationError
 from .ports import (
@@ -92,6 +93,7 @@ __all__ = [
     "EntrypointFormatError",
     "format_entrypoint",
     "parse_entrypoint",
+    "resolve_entrypoint_cached",
     # Parameter utilities
     "make_param_id",
     "digest_bytes",
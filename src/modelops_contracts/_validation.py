@@ -0,0 +1,9 @@
+"""Shared validation helpers."""
+
+# Deletes every lowercase hex digit; a hex string translates to ""
+_HEX_DELETE = str.maketrans("", "", "0123456789abcdef")
+
+
+def _is_hex64(s: str) -> bool:
+    """Check that s is exactly 64 lowercase hex characters."""
+    return len(s) == 64 and not s.translate(_HEX_DELETE)
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Mapping
 
+from ._validation import _is_hex64
 from .errors import ContractViolationError
 
 
@@ -67,7 +68,7 @@ class TableArtifact:
             raise ContractViolationError("checksum is required")
         
         # Validate checksum format (hex string of BLAKE2b-256)
-        if not (len(self.checksum) == 64 and all(c in "0123456789abcdef" for c in self.checksum)):
+        if not _is_hex64(self.checksum):
             raise ContractViolationError(
                 "checksum must be 64-character hex string (BLAKE2b-256)"
             )
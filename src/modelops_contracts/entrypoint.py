@@ -10,17 +10,20 @@ Example: 'covid.models.SEIR/baseline'
 The bundle_ref separately tracks the code version.
 """
 
+import functools
+import importlib
 import re
-from typing import NewType
+from typing import Any, Callable, NewType
 
 EntryPointId = NewType("EntryPointId", str)
 
 # Constants
 ENTRYPOINT_GRAMMAR_VERSION = 2  # Version 2: No digest in entrypoint
 
-# Conservative regex patterns for validation
-_SCENARIO_RE = re.compile(r"^[a-z0-9](?:[a-z0-9-_.]{0,62}[a-z0-9])?$")
-_IMPORT_RE = re.compile(r"^[A-Za-z_][\w.]*\.[A-Za-z_]\w*$")
+# Conservative regex patterns for validation, compiled once at import.
+# Always use fullmatch(): with match(), "$" also accepts a trailing newline.
+_SCENARIO_RE = re.compile(r"[a-z0-9](?:[a-z0-9-_.]{0,62}[a-z0-9])?")
+_IMPORT_RE = re.compile(r"[A-Za-z_][\w.]*\.[A-Za-z_]\w*")
 
 
 class EntrypointFormatError(ValueError):
@@ -41,9 +44,9 @@ def format_entrypoint(import_path: str, scenario: str) -> EntryPointId:
     Raises:
         EntrypointFormatError: If inputs are invalid
     """
-    if not _IMPORT_RE.match(import_path):
+    if not _IMPORT_RE.fullmatch(import_path):
         raise EntrypointFormatError(f"Invalid import_path format: {import_path}")
-    if not _SCENARIO_RE.match(scenario):
+    if not _SCENARIO_RE.fullmatch(scenario):
         raise EntrypointFormatError(f"Invalid scenario slug: {scenario}")
     
     return EntryPointId(f"{import_path}/{scenario}")
@@ -68,30 +71,23 @@ def parse_entrypoint(eid: EntryPointId) -> tuple[str, str]:
         EntrypointFormatError: If format is invalid
     """
     s = str(eid)
+    # Split on the last separator; an empty separator means it is absent
+    import_path, slash, scenario = s.rpartition("/")
+    module_path, colon, object_name = s.rpartition(":")
 
     # Check which format we have
-    if "/" in s and ":" not in s:
+    if slash and not colon:
         # Model format: module/scenario
-        try:
-            import_path, scenario = s.rsplit("/", 1)
-        except ValueError as e:
-            raise EntrypointFormatError(f"Invalid model entrypoint format: {eid}") from e
-
-        if not _IMPORT_RE.match(import_path):
+        if not _IMPORT_RE.fullmatch(import_path):
             raise EntrypointFormatError(f"Invalid import_path format: {import_path}")
-        if not _SCENARIO_RE.match(scenario):
+        if not _SCENARIO_RE.fullmatch(scenario):
             raise EntrypointFormatError(f"Invalid scenario slug: {scenario}")
 
         return import_path, scenario
 
-    elif ":" in s and "/" not in s:
+    elif colon and not slash:
         # Python import format: module:object
-        try:
-            module_path, object_name = s.rsplit(":", 1)
-        except ValueError as e:
-            raise EntrypointFormatError(f"Invalid Python import format: {eid}") from e
-
-        if not _IMPORT_RE.match(module_path):
+        if not _IMPORT_RE.fullmatch(module_path):
             raise EntrypointFormatError(f"Invalid module path format: {module_path}")
         # Object names follow Python identifier rules (letters, numbers, underscores)
         if not object_name.replace("_", "").isalnum():
@@ -99,7 +95,7 @@ def parse_entrypoint(eid: EntryPointId) -> tuple[str, str]:
 
         return module_path, object_name
 
-    elif "/" in s and ":" in s:
+    elif slash and colon:
         # Ambiguous format
         raise EntrypointFormatError(
             f"Ambiguous entrypoint format (contains both / and :): {eid}"
@@ -111,10 +107,50 @@ def parse_entrypoint(eid: EntryPointId) -> tuple[str, str]:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def resolve_entrypoint_cached(eid: EntryPointId) -> Callable[..., Any]:
+    """Resolve an entrypoint ID to the Python object it names.
+
+    Importing the target module and walking its attributes is cheap once
+    but adds milliseconds per task when repeated. Execution environments
+    MUST cache the resolved callable per (bundle_ref, entrypoint) for the
+    lifetime of a worker process; this helper provides that cache for
+    the common case of one bundle per process. Call it once when the
+    first task arrives on a worker and reuse the result.
+
+    Handles both entrypoint formats:
+    - Model format: "pkg.module.Class/scenario" resolves to pkg.module.Class
+    - Python import format: "pkg.module:obj" resolves to pkg.module.obj
+
+    Args:
+        eid: EntryPointId to resolve
+
+    Returns:
+        The resolved object (class or function)
+
+    Raises:
+        EntrypointFormatError: If format is invalid
+        ImportError: If the module cannot be imported
+        AttributeError: If the object does not exist in the module
+    """
+    first, second = parse_entrypoint(eid)
+    if ":" in str(eid):
+        module_path, qualname = first, second
+    else:
+        # Model format: the class is the last component of the import path
+        module_path, qualname = first.rsplit(".", 1)
+
+    obj = importlib.import_module(module_path)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
 __all__ = [
     "EntryPointId",
     "ENTRYPOINT_GRAMMAR_VERSION",
     "EntrypointFormatError",
     "format_entrypoint",
     "parse_entrypoint",
+    "resolve_entrypoint_cached",
 ]
\ No newline at end of file
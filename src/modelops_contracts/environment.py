@@ -11,11 +11,13 @@ that cached results are only reused when the execution environment matches.
 from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from typing import Dict, Optional
+import hashlib
 import json
 import sys
 import platform
 
-from .param_hashing import digest_bytes
+# BLAKE2b state pre-seeded with the namespace prefix (see param_hashing)
+_ENV_HASHER = hashlib.blake2b(b"contracts:env:v1|", digest_size=32)
 
 
 @dataclass(frozen=True)
@@ -72,8 +74,9 @@ class EnvironmentDigest:
         )
 
         # Namespace to avoid collisions
-        namespaced = f"contracts:env:v1|{canonical}"
-        return digest_bytes(namespaced.encode("utf-8"))
+        h = _ENV_HASHER.copy()
+        h.update(canonical.encode("utf-8"))
+        return h.hexdigest()
 
     @classmethod
     def capture_current(cls) -> EnvironmentDigest:
@@ -11,6 +11,7 @@ from typing import Dict, List
 
 # Import ModelEntry from registry where it now lives
 from .registry import ModelEntry
+from ._validation import _is_hex64
 
 
 @dataclass(frozen=True)
@@ -36,8 +37,7 @@ class BundleManifest:
         # Validate bundle_digest format
         if not self.bundle_digest:
             raise ValueError("bundle_digest must be non-empty")
-        if not (len(self.bundle_digest) == 64 and
-                all(c in "0123456789abcdef" for c in self.bundle_digest)):
+        if not _is_hex64(self.bundle_digest):
             raise ValueError("bundle_digest must be 64-character hex string")
 
         # Validate bundle_ref
@@ -17,7 +17,9 @@ rules to ensure determinism across Python versions and platforms.
 """
 
 from __future__ import annotations
+from collections.abc import Mapping
 from typing import Any
+import functools
 import hashlib
 import json
 import math
@@ -25,6 +27,19 @@ import math
 from .errors import ContractViolationError
 
 
+# BLAKE2b state pre-seeded with the namespace prefix; copy() is cheaper
+# than initializing a new hasher and hashing the prefix again
+_PARAM_HASHER = hashlib.blake2b(b"contracts:param:v1|", digest_size=32)
+
+# Reused across calls; json.dumps builds a new encoder whenever non-default
+# options are passed
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False
+)
+
+
 def canonical_scalar(v: Any) -> bool | int | float | str:
     """Canonicalize scalar value for hashing.
 
@@ -54,7 +69,18 @@ def normalize_for_json(obj: Any) -> Any:
     - Lists/tuples become lists
     - None is preserved
     """
-    from collections.abc import Mapping
+    # Exact built-in types, the common case, skip the isinstance chain
+    cls = type(obj)
+    if cls is str or cls is int or cls is bool:
+        return obj
+    elif cls is float:
+        if not math.isfinite(obj):
+            raise ContractViolationError(f"Non-finite float not allowed: {obj}")
+        return obj
+    elif cls is dict:
+        return {k: normalize_for_json(v) for k, v in sorted(obj.items())}
+    elif cls is list or cls is tuple:
+        return [normalize_for_json(item) for item in obj]
 
     if obj is None:
         return None
@@ -81,13 +107,7 @@ def canonical_json(obj: Any) -> bytes:
     - Rejects NaN/Inf
     """
     normalized = normalize_for_json(obj)
-    json_str = json.dumps(
-        normalized,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False
-    )
-    return json_str.encode("utf-8")
+    return _CANONICAL_ENCODER.encode(normalized).encode("utf-8")
 
 
 def digest_bytes(data: bytes) -> str:
@@ -117,10 +137,65 @@ def make_param_id(params: dict) -> str:
         >>> param_id = make_param_id(params)
         >>> # Same params will always produce same ID
     """
+    # Optimizers and sweeps hash the same parameter sets over and over, so
+    # flat scalar dicts are memoized; anything else is hashed directly.
+    key = _param_cache_key(params)
+    if key is None:
+        return _make_param_id(params)
+    return _cached_param_id(key)
+
+
+def _param_cache_key(params: dict) -> tuple | None:
+    """Build a hashable cache key for a flat parameter dict.
+
+    Values are keyed with their exact type because 1, 1.0 and True compare
+    (and hash) equal but serialize differently. Floats are keyed by their
+    hex form so that -0.0 and 0.0 stay distinct. Returns None for anything
+    that isn't a flat dict of scalars with str keys (non-str keys have the
+    same 1/1.0/True problem); those are hashed uncached.
+    """
+    key = []
+    for k, v in params.items():
+        if type(k) is not str:
+            return None
+        cls = type(v)
+        if cls is float:
+            v = v.hex()
+        elif cls is not bool and cls is not int and cls is not str:
+            return None
+        key.append((k, cls, v))
+    # Keys are unique strs, so sorting never compares past the key
+    key.sort()
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=16384)
+def _cached_param_id(key: tuple) -> str:
+    """Compute the param_id for a key built by _param_cache_key."""
+    return _make_param_id(
+        {k: float.fromhex(v) if cls is float else v for k, cls, v in key}
+    )
+
+
+def _make_param_id(params: dict) -> str:
+    """Uncached make_param_id."""
+    # Canonicalize values in one pass over the items; the C JSON encoder
+    # sorts the top-level keys (nested mappings are sorted by normalize_for_json).
+    # Exact scalar types, by far the common case, skip the generic recursion.
+    canonical_params = {}
+    for k, v in params.items():
+        cls = type(v)
+        if cls is float:
+            if not math.isfinite(v):
+                raise ContractViolationError(f"Non-finite float not allowed: {v}")
+        elif cls is not int and cls is not str and cls is not bool:
+            v = normalize_for_json(v)
+        canonical_params[k] = v
+    serialized = _CANONICAL_ENCODER.encode(canonical_params)
     # Use namespacing to avoid collisions
-    canonical_params = normalize_for_json(params)
-    namespaced = f"contracts:param:v1|{json.dumps(canonical_params, separators=(',', ':'), ensure_ascii=False)}"
-    return digest_bytes(namespaced.encode("utf-8"))
+    h = _PARAM_HASHER.copy()
+    h.update(serialized.encode("utf-8"))
+    return h.hexdigest()
 
 
 __all__ = [
@@ -98,6 +98,10 @@ class ExecutionEnvironment(Protocol):
     - Subprocess with isolation
     - Container-based
     - Remote execution
+
+    Implementations MUST cache the resolved entrypoint callable per
+    (bundle_ref, entrypoint) per worker process rather than re-importing
+    it for every task. See resolve_entrypoint_cached().
     """
     # TODO: need aggregation support here too?
     
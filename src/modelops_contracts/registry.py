@@ -14,6 +14,12 @@ from typing import List, Dict, Optional, Any, Tuple, Protocol, runtime_checkable
 import yaml
 from pydantic import BaseModel as PydanticBaseModel, Field, model_validator
 
+# Use the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 # Standard bundle storage location constants
 BUNDLE_STORAGE_DIR = ".modelops-bundle"
@@ -387,7 +393,7 @@ class BundleRegistry(PydanticBaseModel):
             dependencies.add(target.path)
             dependencies.update(target.data)
 
-        return sorted(list(dependencies))
+        return sorted(dependencies)
 
     def save(self, path: Path) -> None:
         """Save registry to YAML file.
@@ -396,7 +402,7 @@ class BundleRegistry(PydanticBaseModel):
             path: Path to YAML file to write
         """
         with open(path, 'w') as f:
-            yaml.safe_dump(self.to_dict(), f, sort_keys=False)
+            yaml.dump(self.to_dict(), f, Dumper=_SafeDumper, sort_keys=False)
 
     @classmethod
     def load(cls, path: Path) -> "BundleRegistry":
@@ -409,7 +415,7 @@ class BundleRegistry(PydanticBaseModel):
             Loaded BundleRegistry instance
         """
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         return cls.from_dict(data)
 
     def to_dict(self) -> Dict[str, Any]:
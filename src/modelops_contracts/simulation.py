@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, replace
-from typing import Optional, Sequence, Any, Mapping, Union, List, Dict
-from types import MappingProxyType
+from typing import Optional, Sequence, Any, Mapping, Union, List, Dict, Iterable
 import hashlib
 import math
+import sys
 
-from .types import UniqueParameterSet
+from .types import UniqueParameterSet, _check_uint64_seed, _freeze_mapping
 from .entrypoint import (
     EntryPointId,
     parse_entrypoint,
@@ -21,8 +21,12 @@ from .artifacts import SimReturn, TableArtifact
 from .types import Scalar
 TableIPC = bytes  # Arrow IPC or Parquet bytes for tabular data
 
+# Keys accepted in SimTask.from_components_batch() items
+_BATCH_REQUIRED_KEYS = frozenset({"params", "seed"})
+_BATCH_ITEM_KEYS = _BATCH_REQUIRED_KEYS | {"outputs", "config", "env"}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SimTask:
     """Specification for a single deterministic simulation task.
     
@@ -47,6 +51,18 @@ class SimTask:
     config: Optional[Mapping[str, Any]] = None
     env: Optional[Mapping[str, Any]] = None
 
+    @classmethod
+    def _check_bundle_ref(cls, bundle_ref: str) -> None:
+        """Raise ContractViolationError unless bundle_ref is a non-empty digest."""
+        if not bundle_ref:
+            raise ContractViolationError("bundle_ref must be non-empty")
+
+        # Validate bundle_ref is a digest (sha256:64-hex-chars or repository@sha256:64-hex-chars)
+        if not cls._is_valid_digest(bundle_ref):
+            raise ContractViolationError(
+                f"bundle_ref must be a digest (sha256:64-hex-chars or repository@sha256:64-hex-chars), got: {bundle_ref}"
+            )
+
     @staticmethod
     def _is_valid_digest(ref: str) -> bool:
         """Check if a bundle reference is a valid digest.
@@ -92,28 +108,35 @@ class SimTask:
             return False
 
     def __post_init__(self):
-        # Validate required fields
-        if not self.bundle_ref:
-            raise ContractViolationError("bundle_ref must be non-empty")
+        self._normalize(validate_entrypoint=True)
 
-        # Validate bundle_ref is a digest (sha256:64-hex-chars or repository@sha256:64-hex-chars)
-        if not self._is_valid_digest(self.bundle_ref):
-            raise ContractViolationError(
-                f"bundle_ref must be a digest (sha256:64-hex-chars or repository@sha256:64-hex-chars), got: {self.bundle_ref}"
-            )
+    def _normalize(self, *, validate_entrypoint: bool, validate_bundle_ref: bool = True) -> None:
+        """Validate and freeze fields in place.
+
+        Args:
+            validate_entrypoint: Parse the entrypoint to check its format.
+                Callers that built it with format_entrypoint() pass False.
+            validate_bundle_ref: Check the bundle_ref digest format.
+                Callers reusing an already-checked bundle_ref pass False.
+        """
+        if validate_bundle_ref:
+            self._check_bundle_ref(self.bundle_ref)
 
         if not self.entrypoint:
             raise ContractViolationError("entrypoint must be non-empty")
         
         # Validate entrypoint format if it's a string
-        if isinstance(self.entrypoint, str):
+        if validate_entrypoint and isinstance(self.entrypoint, str):
             try:
                 # Validate it can be parsed
                 parse_entrypoint(EntryPointId(self.entrypoint))
-                # Convert to EntryPointId
-                object.__setattr__(self, "entrypoint", EntryPointId(self.entrypoint))
             except EntrypointFormatError as e:
                 raise ContractViolationError(f"Invalid entrypoint format: {e}") from e
+
+        # Intern the validated strings: tasks in a batch share the same
+        # bundle_ref and usually the same entrypoint, so keep one copy
+        object.__setattr__(self, "bundle_ref", sys.intern(str(self.bundle_ref)))
+        object.__setattr__(self, "entrypoint", EntryPointId(sys.intern(str(self.entrypoint))))
         
         if not isinstance(self.params, UniqueParameterSet):
             raise ContractViolationError(
@@ -121,8 +144,7 @@ class SimTask:
             )
         if not isinstance(self.seed, int):
             raise ContractViolationError(f"seed must be int, got {type(self.seed).__name__}")
-        if not (0 <= self.seed <= 2**64 - 1):
-            raise ContractViolationError(f"seed {self.seed} out of uint64 range")
+        _check_uint64_seed(self.seed)
         
         # Normalize outputs to sorted tuple for determinism
         if self.outputs is not None:
@@ -130,14 +152,79 @@ class SimTask:
         
         # Freeze config and env as MappingProxyType for immutability
         if self.config is not None:
-            frozen_config = MappingProxyType(dict(self.config))
-            object.__setattr__(self, "config", frozen_config)
+            object.__setattr__(self, "config", _freeze_mapping(self.config))
         
         if self.env is not None:
-            frozen_env = MappingProxyType(dict(self.env))
-            object.__setattr__(self, "env", frozen_env)
+            object.__setattr__(self, "env", _freeze_mapping(self.env))
     
     
+    def _with_seed(self, seed: int) -> "SimTask":
+        """Return a copy of this task with a different seed.
+
+        Fast path for replicate generation: every other field was already
+        validated and frozen on this instance, so they are shared by
+        reference instead of re-running __post_init__. Only the seed is
+        checked. Subclasses may add fields, so they go through replace().
+        """
+        if type(self) is not SimTask:
+            return replace(self, seed=seed)
+
+        if not isinstance(seed, int):
+            raise ContractViolationError(f"seed must be int, got {type(seed).__name__}")
+        _check_uint64_seed(seed)
+
+        task = object.__new__(SimTask)
+        object.__setattr__(task, "bundle_ref", self.bundle_ref)
+        object.__setattr__(task, "entrypoint", self.entrypoint)
+        object.__setattr__(task, "params", self.params)
+        object.__setattr__(task, "seed", seed)
+        object.__setattr__(task, "outputs", self.outputs)
+        object.__setattr__(task, "config", self.config)
+        object.__setattr__(task, "env", self.env)
+        return task
+
+    @classmethod
+    def _from_validated(
+        cls,
+        *,
+        bundle_ref: str,
+        entrypoint: EntryPointId,
+        params: UniqueParameterSet,
+        seed: int,
+        outputs: Optional[Sequence[str]] = None,
+        config: Optional[Mapping[str, Any]] = None,
+        env: Optional[Mapping[str, Any]] = None,
+        validate_bundle_ref: bool = True,
+    ) -> "SimTask":
+        """Construct a task whose entrypoint is already known to be valid.
+
+        Runs the same validation as the constructor except re-parsing the
+        entrypoint, which format_entrypoint() has already checked, and
+        optionally the bundle_ref check. Subclasses may add fields with
+        defaults, so they go through the regular constructor.
+        """
+        if cls is not SimTask:
+            return cls(
+                bundle_ref=bundle_ref,
+                entrypoint=entrypoint,
+                params=params,
+                seed=seed,
+                outputs=outputs,
+                config=config,
+                env=env,
+            )
+
+        task = object.__new__(SimTask)
+        object.__setattr__(task, "bundle_ref", bundle_ref)
+        object.__setattr__(task, "entrypoint", entrypoint)
+        object.__setattr__(task, "params", params)
+        object.__setattr__(task, "seed", seed)
+        object.__setattr__(task, "outputs", outputs)
+        object.__setattr__(task, "config", config)
+        object.__setattr__(task, "env", env)
+        task._normalize(validate_entrypoint=False, validate_bundle_ref=validate_bundle_ref)
+        return task
+
     @classmethod
     def from_components(
         cls,
@@ -193,20 +280,87 @@ class SimTask:
         # Format the entrypoint from components
         entrypoint = format_entrypoint(import_path, scenario)
         
-        # Create with auto-generated param_id
-        return cls(
+        # Create with auto-generated param_id; the entrypoint was validated
+        # by format_entrypoint so it is not parsed again
+        return cls._from_validated(
             bundle_ref=bundle_ref,
             entrypoint=entrypoint,
             params=UniqueParameterSet.from_dict(params),
             seed=seed,
-            outputs=tuple(sorted(outputs)) if outputs else None,
+            outputs=outputs if outputs else None,  # sorted once by _normalize
             config=config,
             env=env,
         )
+
+    @classmethod
+    def from_components_batch(
+        cls,
+        *,
+        import_path: str,
+        scenario: str,
+        bundle_ref: str,
+        items: Iterable[Mapping[str, Any]],
+    ) -> List["SimTask"]:
+        """Create many SimTasks that share an entrypoint and bundle.
+
+        Equivalent to calling from_components() once per item, but the
+        entrypoint is formatted and the bundle_ref validated only once, and
+        all tasks share the same interned strings.
+
+        Args:
+            import_path: Python import path to simulation class
+            scenario: Scenario name, must be lowercase slug
+            bundle_ref: Full OCI bundle reference shared by every task
+            items: Per-task arguments as mappings with required ``params``
+                and ``seed`` keys and optional ``outputs``, ``config`` and
+                ``env`` keys, as accepted by from_components()
+
+        Raises:
+            ContractViolationError: If an item has unknown or missing keys,
+                or any field fails validation
+
+        Returns:
+            List of SimTask instances in the order of items
+
+        Example:
+            >>> tasks = SimTask.from_components_batch(
+            ...     import_path="covid.models.SEIR",
+            ...     scenario="lockdown",
+            ...     bundle_ref="sha256:abc123...",
+            ...     items=[{"params": {"R0": r0}, "seed": 42} for r0 in (2.0, 2.5)],
+            ... )
+        """
+        # Validate and intern the shared strings once, even for empty batches
+        cls._check_bundle_ref(bundle_ref)
+        bundle_ref = sys.intern(str(bundle_ref))
+        entrypoint = EntryPointId(sys.intern(format_entrypoint(import_path, scenario)))
+
+        tasks = []
+        for item in items:
+            keys = item.keys()
+            if not keys <= _BATCH_ITEM_KEYS:
+                unknown = ", ".join(sorted(map(str, keys - _BATCH_ITEM_KEYS)))
+                raise ContractViolationError(f"Unknown batch item keys: {unknown}")
+            if not _BATCH_REQUIRED_KEYS <= keys:
+                missing = ", ".join(sorted(_BATCH_REQUIRED_KEYS - keys))
+                raise ContractViolationError(f"Missing batch item keys: {missing}")
+
+            outputs = item.get("outputs")
+            tasks.append(cls._from_validated(
+                bundle_ref=bundle_ref,
+                entrypoint=entrypoint,
+                params=UniqueParameterSet.from_dict(item["params"]),
+                seed=item["seed"],
+                outputs=outputs if outputs else None,
+                config=item.get("config"),
+                env=item.get("env"),
+                validate_bundle_ref=False,
+            ))
+        return tasks
     
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplicateSet:
     """Group of simulation tasks with same parameters but different seeds.
     
@@ -217,24 +371,39 @@ class ReplicateSet:
     n_replicates: int
     seed_offset: int = 0  # Starting seed for replicates
     
+    @property
+    def seeds(self) -> range:
+        """Seeds of the replicates, in order.
+
+        Lets callers that only need seeds skip building SimTask objects.
+        """
+        start = self.base_task.seed + self.seed_offset
+        return range(start, start + self.n_replicates)
+
     def tasks(self) -> List[SimTask]:
         """Generate individual SimTask instances for each replicate."""
-        return [
-            replace(self.base_task, seed=self.base_task.seed + self.seed_offset + i)
-            for i in range(self.n_replicates)
-        ]
+        with_seed = self.base_task._with_seed
+        return [with_seed(seed) for seed in self.seeds]
 
 
-@dataclass(frozen=True)
-class AggregationTask:
+class _AggregationIdSlot:
+    """Slot for AggregationTask's memoized ID, kept out of its dataclass fields."""
+    __slots__ = ("_aggregation_id",)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class AggregationTask(_AggregationIdSlot):
     """Task for aggregating simulation results and computing loss.
     
     This runs the target evaluation entrypoint on a set of SimReturns,
     typically to compute loss against empirical data.
+
+    Equality and hashing use aggregation_id() rather than comparing the
+    sim_returns element by element.
     """
     bundle_ref: str
     target_entrypoint: Union[str, EntryPointId]  # e.g., 'targets.covid/deaths'
-    sim_returns: List[SimReturn]  # Results to aggregate
+    sim_returns: Sequence[SimReturn]  # Results to aggregate, stored as a tuple
     target_data: Optional[Dict[str, Any]] = None  # Optional empirical data
     
     def __post_init__(self):
@@ -249,19 +418,56 @@ class AggregationTask:
         if isinstance(self.target_entrypoint, str):
             try:
                 parse_entrypoint(EntryPointId(self.target_entrypoint))
-                object.__setattr__(self, "target_entrypoint", EntryPointId(self.target_entrypoint))
             except EntrypointFormatError as e:
                 raise ContractViolationError(f"Invalid target_entrypoint: {e}") from e
+
+        # Snapshot the results so the memoized aggregation_id can't go stale
+        object.__setattr__(self, "sim_returns", tuple(self.sim_returns))
+
+        # Store as an interned plain str, as SimTask does for its entrypoint
+        object.__setattr__(
+            self, "target_entrypoint", EntryPointId(sys.intern(str(self.target_entrypoint)))
+        )
     
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AggregationTask):
+            return NotImplemented
+        return (
+            self.bundle_ref == other.bundle_ref
+            and self.aggregation_id() == other.aggregation_id()
+            and self.target_data == other.target_data
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.bundle_ref, self.aggregation_id()))
+
     def aggregation_id(self) -> str:
-        """Compute unique ID for this aggregation task."""
-        # Hash based on target and task_ids of results
-        task_ids = [r.task_id for r in self.sim_returns]
-        content = f"{self.target_entrypoint}:{','.join(sorted(task_ids))}"
-        return hashlib.blake2b(content.encode(), digest_size=32).hexdigest()[:16]
+        """Compute unique ID for this aggregation task.
+
+        The ID is computed on first call and cached on the instance.
+        """
+        # The slot is unset until the first call (and again after unpickling)
+        agg_id = getattr(self, "_aggregation_id", None)
+        if agg_id is not None:
+            return agg_id
+
+        # Hash based on target and sorted task_ids of results, streamed as
+        # "{target}:{id1},{id2},..." without building the joined string
+        h = hashlib.blake2b(digest_size=32)
+        h.update(f"{self.target_entrypoint}:".encode())
+        separator = b""
+        for task_id in sorted(r.task_id for r in self.sim_returns):
+            h.update(separator)
+            h.update(task_id.encode())
+            separator = b","
+        # Not digest_size=8: BLAKE2b's digest size changes the output, not
+        # just its length, and aggregation IDs must stay stable across versions
+        agg_id = h.hexdigest()[:16]
+        object.__setattr__(self, "_aggregation_id", agg_id)
+        return agg_id
 
 
-@dataclass(frozen=True) 
+@dataclass(frozen=True, slots=True)
 class AggregationReturn:
     """Result from target evaluation/aggregation.
     
@@ -67,21 +67,27 @@ class SimulationStudy:
 
         # Create tasks for all parameter sets and replicates
         tasks = []
-        for param_dict in self.parameter_sets:
-            # Get stable parameter ID for this parameter set
-            param_id = make_param_id(param_dict)
-
-            for replicate_idx in range(self.n_replicates):
-                # Create task with deterministic seed
-                task = SimTask.from_components(
+        if self.n_replicates > 0:
+            for param_dict in self.parameter_sets:
+                # Get stable parameter ID for this parameter set
+                param_id = make_param_id(param_dict)
+
+                # Build the first replicate once; the rest differ only by seed,
+                # so they share its validated entrypoint and parameter set
+                base_task = SimTask.from_components(
                     import_path=self.model,
                     scenario=self.scenario,
                     bundle_ref=bundle_ref,
                     params=param_dict,  # from_components will create UniqueParameterSet
-                    seed=self._generate_seed(param_id, replicate_idx),
+                    seed=self._generate_seed(param_id, 0),
                     outputs=self.outputs
                 )
-                tasks.append(task)
+                tasks.append(base_task)
+                for replicate_idx in range(1, self.n_replicates):
+                    # Create task with deterministic seed
+                    tasks.append(
+                        base_task._with_seed(self._generate_seed(param_id, replicate_idx))
+                    )
 
         # Create job directly with tasks (no batch wrapper)
         if not job_id:
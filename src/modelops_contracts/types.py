@@ -3,8 +3,9 @@
 import math
 import json
 import enum
+import itertools
 from dataclasses import dataclass, field
-from typing import Mapping, Any
+from typing import Mapping, Any, Optional
 from collections.abc import Mapping as MappingABC
 from types import MappingProxyType
 
@@ -16,6 +17,7 @@ Scalar = bool | int | float | str
 
 # Constants
 MAX_DIAG_BYTES = 65536  # 64KB limit for diagnostics to prevent unbounded growth
+_EXACT_SCALAR_TYPES = frozenset((bool, int, float, str))
 
 
 class TrialStatus(enum.Enum):
@@ -48,15 +50,36 @@ def _canon_scalar(v: Any) -> Scalar:
 
 
 
-def _approx_size(obj: Mapping[str, Any]) -> int:
-    """Approximate JSON size of object."""
+def _check_uint64_seed(seed: int) -> None:
+    """Raise ContractViolationError unless 0 <= seed < 2**64."""
+    # seed >> 64 is non-zero exactly when seed >= 2**64
+    if seed < 0 or seed >> 64:
+        raise ContractViolationError(f"seed {seed} out of uint64 range")
+
+
+def _freeze_mapping(mapping: Mapping[str, Any]) -> MappingProxyType:
+    """Return a read-only view of a private copy of mapping.
+
+    Always copies, including MappingProxyType inputs: a caller's proxy is a
+    live view of a dict the caller can still change.
+    """
+    return MappingProxyType(dict(mapping))
+
+
+# Compact encoder for the TrialResult size check, built once at import
+# rather than per result
+_DIAG_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode_diagnostics(obj: Mapping[str, Any]) -> str:
+    """Serialize diagnostics to compact JSON."""
     try:
-        return len(json.dumps(obj, separators=(",", ":"), ensure_ascii=False))
+        return _DIAG_ENCODER.encode(obj)
     except Exception:
         raise ContractViolationError("diagnostics must be JSON-serializable")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UniqueParameterSet:
     """Immutable parameter set with stable ID."""
     params: Mapping[str, Scalar]
@@ -66,19 +89,22 @@ class UniqueParameterSet:
         if not self.param_id:
             raise ContractViolationError("param_id must be non-empty")
         
-        # Freeze params: copy to dict (to normalize) then wrap with mapping proxy
-        frozen = MappingProxyType(dict(self.params))
+        # Freeze params: copy to a private dict and wrap with a mapping proxy
+        frozen = _freeze_mapping(self.params)
         object.__setattr__(self, "params", frozen)
         
-        # Validate parameter types and values
+        # Validate parameter types and values. Exact scalar types are
+        # checked with one type() call; subclasses fall back to isinstance
         for key, value in frozen.items():
-            if not isinstance(value, (float, int, str, bool)):
-                raise ContractViolationError(
-                    f"Parameter {key} has invalid type {type(value).__name__}"
-                )
-            if isinstance(value, float) and not math.isfinite(value):
+            cls = type(value)
+            if cls is float or (cls not in _EXACT_SCALAR_TYPES and isinstance(value, float)):
+                if not math.isfinite(value):
+                    raise ContractViolationError(
+                        f"Parameter {key} has non-finite value: {value}"
+                    )
+            elif cls not in _EXACT_SCALAR_TYPES and not isinstance(value, (int, str, bool)):
                 raise ContractViolationError(
-                    f"Parameter {key} has non-finite value: {value}"
+                    f"Parameter {key} has invalid type {cls.__name__}"
                 )
     
     @classmethod
@@ -87,7 +113,7 @@ class UniqueParameterSet:
         return cls(params=params, param_id=make_param_id(params))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeedInfo:
     """Seed configuration for reproducibility."""
     base_seed: int
@@ -100,15 +126,14 @@ class SeedInfo:
             object.__setattr__(self, 'replicate_seeds', tuple(self.replicate_seeds))
         
         # Validate all seeds are integers
-        all_seeds = [self.base_seed, self.trial_seed] + list(self.replicate_seeds)
+        all_seeds = itertools.chain((self.base_seed, self.trial_seed), self.replicate_seeds)
         for seed in all_seeds:
             if not isinstance(seed, int):
                 raise ContractViolationError(f"Seeds must be integers, got {type(seed).__name__}")
-            if not (0 <= seed <= 2**64 - 1):
-                raise ContractViolationError(f"Seed {seed} out of uint64 range")
+            _check_uint64_seed(seed)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrialResult:
     """Result of evaluating a parameter set."""
     param_id: str
@@ -128,10 +153,35 @@ class TrialResult:
         if not isinstance(self.diagnostics, MappingABC):
             object.__setattr__(self, 'diagnostics', dict(self.diagnostics))
         
-        # Validate diagnostics size and serializability
-        if _approx_size(dict(self.diagnostics)) > MAX_DIAG_BYTES:
+        # Validate diagnostics size and serializability. The JSON encoder only
+        # accepts real dicts, so copy other mappings (e.g. MappingProxyType)
+        diagnostics = self.diagnostics
+        if not isinstance(diagnostics, dict):
+            diagnostics = dict(diagnostics)
+        if len(_encode_diagnostics(diagnostics)) > MAX_DIAG_BYTES:
             raise ContractViolationError(f"diagnostics too large (>{MAX_DIAG_BYTES} bytes)")
 
+    @classmethod
+    def _unchecked(
+        cls,
+        *,
+        param_id: str,
+        loss: float,
+        diagnostics: Optional[Mapping[str, Any]] = None,
+        status: TrialStatus = TrialStatus.COMPLETED,
+    ) -> 'TrialResult':
+        """Construct without validation, for trusted internal callers.
+
+        Skips the param_id, finite-loss and diagnostics size checks. The
+        diagnostics mapping is stored as given, not copied.
+        """
+        result = object.__new__(cls)
+        object.__setattr__(result, 'param_id', param_id)
+        object.__setattr__(result, 'loss', loss)
+        object.__setattr__(result, 'diagnostics', {} if diagnostics is None else diagnostics)
+        object.__setattr__(result, 'status', status)
+        return result
+
 
 __all__ = [
     "TrialStatus",
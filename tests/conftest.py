@@ -0,0 +1,35 @@
+"""Shared test fixtures.
+
+The contract types are immutable, so tests that only need *a* valid
+instance share one per module instead of constructing their own.
+"""
+
+import pytest
+
+from modelops_contracts import SimTask, TableArtifact
+
+TEST_BUNDLE_REF = "sha256:" + "a" * 64
+
+
+@pytest.fixture(scope="module")
+def inline_artifact() -> TableArtifact:
+    """Small inline TableArtifact."""
+    return TableArtifact(size=100, inline=b"x" * 100, checksum="a" * 64)
+
+
+@pytest.fixture(scope="module")
+def ref_artifact() -> TableArtifact:
+    """CAS-referenced TableArtifact."""
+    return TableArtifact(size=2000000, ref="outputs/large_table", checksum="b" * 64)
+
+
+@pytest.fixture(scope="module")
+def sample_task() -> SimTask:
+    """Minimal valid SimTask."""
+    return SimTask.from_components(
+        import_path="test.Model",
+        scenario="baseline",
+        bundle_ref=TEST_BUNDLE_REF,
+        params={"x": 1},
+        seed=42,
+    )
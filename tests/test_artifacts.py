@@ -1,8 +1,26 @@
 """Tests for artifact types."""
 
+import re
+
 import pytest
 from modelops_contracts import TableArtifact, SimReturn, INLINE_CAP, ContractViolationError
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_MSG_INLINE_CAP = re.compile(f"inline artifacts must be <= {INLINE_CAP} bytes")
+_MSG_SIZE_NEGATIVE = re.compile("size must be non-negative")
+_MSG_INLINE_OR_REF = re.compile("Must provide exactly one of inline or ref")
+_MSG_INLINE_SIZE_MISMATCH = re.compile("inline bytes length .* doesn't match size")
+_MSG_EMPTY_REF = re.compile("ref must be non-empty when provided")
+_MSG_CHECKSUM_REQUIRED = re.compile("checksum is required")
+_MSG_CHECKSUM_FORMAT = re.compile("checksum must be 64-character hex string")
+_MSG_EMPTY_TASK_ID = re.compile("task_id must be non-empty")
+_MSG_EMPTY_OUTPUTS = re.compile("outputs must contain at least one artifact")
+_MSG_OUTPUT_TYPE = re.compile("Output .* must be TableArtifact")
+
+# Payloads shared across tests (bytes are immutable)
+_INLINE_CAP_BYTES = b"x" * INLINE_CAP
+_PAYLOAD_100 = b"x" * 100
+
 
 def test_table_artifact_inline():
     """Test TableArtifact with inline data."""
@@ -42,7 +60,7 @@ def test_table_artifact_reference():
 def test_table_artifact_inline_size_limit():
     """Test that inline artifacts respect size limit."""
     # At the limit should work
-    data = b"x" * INLINE_CAP
+    data = _INLINE_CAP_BYTES
     artifact = TableArtifact(
         size=INLINE_CAP,
         inline=data,
@@ -51,86 +69,54 @@ def test_table_artifact_inline_size_limit():
     assert artifact.size == INLINE_CAP
     
     # Over the limit should fail
-    with pytest.raises(ContractViolationError, match=f"inline artifacts must be <= {INLINE_CAP} bytes"):
+    with pytest.raises(ContractViolationError, match=_MSG_INLINE_CAP):
         TableArtifact(
             size=INLINE_CAP + 1,
-            inline=b"x" * (INLINE_CAP + 1),
+            inline=_INLINE_CAP_BYTES + b"x",
             checksum="d" * 64
         )
 
 
-def test_table_artifact_validation():
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"size": -1, "inline": b"data", "checksum": "e" * 64}, _MSG_SIZE_NEGATIVE),
+        (
+            {"size": 100, "inline": b"data", "ref": "path/to/file", "checksum": "f" * 64},
+            _MSG_INLINE_OR_REF,
+        ),
+        ({"size": 100, "checksum": "0" * 64}, _MSG_INLINE_OR_REF),
+        ({"size": 100, "inline": b"short", "checksum": "1" * 64}, _MSG_INLINE_SIZE_MISMATCH),
+        ({"size": 100, "ref": "", "checksum": "2" * 64}, _MSG_EMPTY_REF),
+        ({"size": 100, "inline": _PAYLOAD_100, "checksum": ""}, _MSG_CHECKSUM_REQUIRED),
+        (
+            {"size": 100, "inline": _PAYLOAD_100, "checksum": "invalid_checksum"},
+            _MSG_CHECKSUM_FORMAT,
+        ),
+        ({"size": 100, "inline": _PAYLOAD_100, "checksum": "abc123"}, _MSG_CHECKSUM_FORMAT),
+    ],
+    ids=[
+        "negative_size",
+        "both_inline_and_ref",
+        "neither_inline_nor_ref",
+        "inline_size_mismatch",
+        "empty_ref",
+        "missing_checksum",
+        "checksum_not_hex",
+        "checksum_too_short",
+    ],
+)
+def test_table_artifact_validation(kwargs, match):
     """Test TableArtifact validation."""
-    # Negative size
-    with pytest.raises(ContractViolationError, match="size must be non-negative"):
-        TableArtifact(
-            size=-1,
-            inline=b"data",
-            checksum="e" * 64
-        )
-    
-    # Both inline and ref
-    with pytest.raises(ContractViolationError, match="Must provide exactly one of inline or ref"):
-        TableArtifact(
-            size=100,
-            inline=b"data",
-            ref="path/to/file",
-            checksum="f" * 64
-        )
-    
-    # Neither inline nor ref
-    with pytest.raises(ContractViolationError, match="Must provide exactly one of inline or ref"):
-        TableArtifact(
-            size=100,
-            checksum="0" * 64
-        )
-    
-    # Inline size mismatch
-    with pytest.raises(ContractViolationError, match="inline bytes length .* doesn't match size"):
-        TableArtifact(
-            size=100,
-            inline=b"short",
-            checksum="1" * 64
-        )
-    
-    # Empty ref
-    with pytest.raises(ContractViolationError, match="ref must be non-empty when provided"):
-        TableArtifact(
-            size=100,
-            ref="",
-            checksum="2" * 64
-        )
-    
-    # Missing checksum
-    with pytest.raises(ContractViolationError, match="checksum is required"):
-        TableArtifact(
-            size=100,
-            inline=b"x" * 100,
-            checksum=""
-        )
-    
-    # Invalid checksum format (not hex)
-    with pytest.raises(ContractViolationError, match="checksum must be 64-character hex string"):
-        TableArtifact(
-            size=100,
-            inline=b"x" * 100,
-            checksum="invalid_checksum"
-        )
-    
-    # Invalid checksum length
-    with pytest.raises(ContractViolationError, match="checksum must be 64-character hex string"):
-        TableArtifact(
-            size=100,
-            inline=b"x" * 100,
-            checksum="abc123"  # Too short
-        )
+    with pytest.raises(ContractViolationError, match=match):
+        TableArtifact(**kwargs)
 
 
 def test_table_artifact_frozen():
     """Test that TableArtifact is immutable."""
     artifact = TableArtifact(
         size=100,
-        inline=b"x" * 100,
+        inline=_PAYLOAD_100,
         checksum="3" * 64
     )
     
@@ -143,10 +129,9 @@ def test_table_artifact_frozen():
 
 def test_sim_return_basic():
     """Test basic SimReturn creation."""
-    data1 = b"output1_data" * 4
     output1 = TableArtifact(
-        size=len(data1),
-        inline=data1,
+        size=len(_PAYLOAD_100),
+        inline=_PAYLOAD_100,
         checksum="4" * 64
     )
     
@@ -170,13 +155,9 @@ def test_sim_return_basic():
     assert result.cached is False
 
 
-def test_sim_return_with_optional_fields():
+def test_sim_return_with_optional_fields(inline_artifact):
     """Test SimReturn with all optional fields."""
-    output = TableArtifact(
-        size=100,
-        inline=b"x" * 100,
-        checksum="7" * 64
-    )
+    output = inline_artifact
     
     metrics = {"runtime_seconds": 42.5, "memory_mb": 1024.0}
     
@@ -193,43 +174,24 @@ def test_sim_return_with_optional_fields():
     assert result.cached is True
 
 
-def test_sim_return_validation():
+@pytest.mark.parametrize(
+    "task_id,make_outputs,match",
+    [
+        ("", lambda artifact: {"out": artifact}, _MSG_EMPTY_TASK_ID),
+        ("task_id", lambda artifact: {}, _MSG_EMPTY_OUTPUTS),
+        ("task_id", lambda artifact: {"bad": "not an artifact"}, _MSG_OUTPUT_TYPE),
+    ],
+    ids=["empty_task_id", "empty_outputs", "wrong_output_type"],
+)
+def test_sim_return_validation(inline_artifact, task_id, make_outputs, match):
     """Test SimReturn validation."""
-    output = TableArtifact(
-        size=100,
-        inline=b"x" * 100,
-        checksum="9" * 64
-    )
-    
-    # Empty task_id
-    with pytest.raises(ContractViolationError, match="task_id must be non-empty"):
-        SimReturn(
-            task_id="",
-            outputs={"out": output}
-        )
-    
-    # Empty outputs
-    with pytest.raises(ContractViolationError, match="outputs must contain at least one artifact"):
-        SimReturn(
-            task_id="task_id",
-            outputs={}
-        )
-    
-    # Wrong type in outputs
-    with pytest.raises(ContractViolationError, match="Output .* must be TableArtifact"):
-        SimReturn(
-            task_id="task_id",
-            outputs={"bad": "not an artifact"}
-        )
+    with pytest.raises(ContractViolationError, match=match):
+        SimReturn(task_id=task_id, outputs=make_outputs(inline_artifact))
 
 
-def test_sim_return_frozen():
+def test_sim_return_frozen(inline_artifact):
     """Test that SimReturn is immutable."""
-    output = TableArtifact(
-        size=100,
-        inline=b"x" * 100,
-        checksum="d" * 64
-    )
+    output = inline_artifact
     
     result = SimReturn(
         task_id="immutable_task",
@@ -1,5 +1,9 @@
 """Basic contract tests."""
 
+import hashlib
+import json
+from dataclasses import asdict
+
 import pytest
 from modelops_contracts import (
     UniqueParameterSet,
@@ -9,6 +13,7 @@ from modelops_contracts import (
     ContractViolationError,
     make_param_id,
 )
+from modelops_contracts.param_hashing import canonical_json
 
 
 def test_parameter_set():
@@ -74,6 +79,22 @@ def test_diagnostics_size_limit():
         )
 
 
+def test_trial_result_asdict_roundtrip():
+    """Test TrialResult survives an asdict round-trip."""
+    result = TrialResult(param_id="abc123", loss=0.5, diagnostics={"iters": 10})
+    assert TrialResult(**asdict(result)) == result
+
+
+def test_trial_result_unchecked():
+    """Test trusted construction matches the validated constructor."""
+    checked = TrialResult(param_id="abc123", loss=0.5, diagnostics={"iters": 10})
+    unchecked = TrialResult._unchecked(param_id="abc123", loss=0.5, diagnostics={"iters": 10})
+    assert unchecked == checked
+
+    default = TrialResult._unchecked(param_id="abc123", loss=0.5)
+    assert default == TrialResult(param_id="abc123", loss=0.5)
+
+
 def test_seed_info():
     """Test seed info with validation."""
     seeds = SeedInfo(
@@ -92,6 +113,12 @@ def test_seed_info():
             replicate_seeds=[],
         )
 
+    # uint64 bounds are inclusive of 0 and 2**64 - 1
+    SeedInfo(base_seed=0, trial_seed=2**64 - 1, replicate_seeds=[])
+    for bad in (-1, 2**64):
+        with pytest.raises(ContractViolationError, match="seed .* out of uint64 range"):
+            SeedInfo(base_seed=42, trial_seed=1, replicate_seeds=[bad])
+
 
 def test_immutability():
     """Test that all types are truly immutable."""
@@ -141,4 +168,43 @@ def test_finite_loss_validation():
         loss=float("-inf"),
         status=TrialStatus.TIMEOUT,
     )
-    assert result.status == TrialStatus.TIMEOUT
\ No newline at end of file
+    assert result.status == TrialStatus.TIMEOUT
+
+
+def test_param_id_cache_distinguishes_types():
+    """Test that memoized param_ids stay distinct for equal-hashing values."""
+    variants = [{"x": 1}, {"x": 1.0}, {"x": True}, {"x": 0.0}, {"x": -0.0}]
+    for params in variants:
+        serialized = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        expected = hashlib.blake2b(
+            b"contracts:param:v1|" + serialized.encode(), digest_size=32
+        ).hexdigest()
+        # Twice: once to populate the cache, once to hit it
+        assert make_param_id(params) == expected
+        assert make_param_id(params) == expected
+        assert UniqueParameterSet.from_dict(params).param_id == expected
+
+    # 1/1.0/True and 0.0/-0.0 serialize differently, so IDs must differ
+    ids = {make_param_id(p) for p in variants}
+    assert len(ids) == len(variants)
+
+    # The same holds for keys: 1, 1.0 and True are equal dict keys but
+    # serialize as "1", "1.0" and "true"
+    key_variants = [{1: 0.5}, {1.0: 0.5}, {True: 0.5}]
+    for params in key_variants:
+        serialized = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        expected = hashlib.blake2b(
+            b"contracts:param:v1|" + serialized.encode(), digest_size=32
+        ).hexdigest()
+        assert make_param_id(params) == expected
+        assert make_param_id(params) == expected
+    assert len({make_param_id(p) for p in key_variants}) == len(key_variants)
+
+
+def test_canonical_json():
+    """Test canonical JSON is compact, key-sorted UTF-8."""
+    obj = {"b": [1, {"z": 0.5, "y": "é"}], "a": None}
+    assert canonical_json(obj) == '{"a":null,"b":[1,{"y":"é","z":0.5}]}'.encode("utf-8")
+
+    with pytest.raises(ContractViolationError):
+        canonical_json({"x": float("nan")})
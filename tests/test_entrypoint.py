@@ -1,5 +1,8 @@
 """Tests for entrypoint formatting and parsing."""
 
+import collections
+import os.path
+
 import pytest
 from modelops_contracts import (
     EntryPointId,
@@ -7,6 +10,7 @@ from modelops_contracts import (
     EntrypointFormatError,
     format_entrypoint,
     parse_entrypoint,
+    resolve_entrypoint_cached,
 )
 
 
@@ -158,4 +162,33 @@ def test_edge_cases():
         "_internal.package_123.MyClass_ABC",
         "test"
     )
-    assert "_internal.package_123.MyClass_ABC" in str(eid)
\ No newline at end of file
+    assert "_internal.package_123.MyClass_ABC" in str(eid)
+
+
+def test_resolve_entrypoint_cached():
+    """Test resolving both entrypoint formats to Python objects."""
+    # Model format resolves the class named by the import path
+    obj = resolve_entrypoint_cached(EntryPointId("collections.OrderedDict/baseline"))
+    assert obj is collections.OrderedDict
+
+    # Python import format resolves module:object
+    fn = resolve_entrypoint_cached(EntryPointId("os.path:join"))
+    assert fn is os.path.join
+
+    # Repeated lookups hit the cache
+    hits = resolve_entrypoint_cached.cache_info().hits
+    resolve_entrypoint_cached(EntryPointId("os.path:join"))
+    assert resolve_entrypoint_cached.cache_info().hits == hits + 1
+
+    with pytest.raises(EntrypointFormatError):
+        resolve_entrypoint_cached(EntryPointId("no_separator"))
+
+
+def test_trailing_newline_rejected():
+    """Test that a trailing newline doesn't slip past validation."""
+    with pytest.raises(EntrypointFormatError, match="Invalid import_path"):
+        format_entrypoint("pkg.Model\n", "baseline")
+    with pytest.raises(EntrypointFormatError, match="Invalid scenario slug"):
+        format_entrypoint("pkg.Model", "baseline\n")
+    with pytest.raises(EntrypointFormatError, match="Invalid scenario slug"):
+        parse_entrypoint(EntryPointId("pkg.Model/baseline\n"))
@@ -212,4 +212,34 @@ class TestBundleManifest:
         assert "models.a.ModelA/s2" in entrypoints
         assert "models.b.ModelB/baseline" in entrypoints
         # Should be sorted
-        assert entrypoints == sorted(entrypoints)
\ No newline at end of file
+        assert entrypoints == sorted(entrypoints)
+
+    def test_list_all_entrypoints_tracks_models(self):
+        """Entrypoint listing is sorted and reflects later changes to models."""
+        model = ModelEntry(
+            entrypoint="models.sir:SIR",
+            path="models/sir.py",
+            class_name="SIR",
+            scenarios=["b", "a"],
+        )
+        manifest = BundleManifest(
+            bundle_ref="local://test",
+            bundle_digest="a" * 64,
+            models={"models.sir:SIR": model},
+        )
+
+        first = manifest.list_all_entrypoints()
+        assert first == ["models.sir:SIR", "models.sir:SIR/a", "models.sir:SIR/b"]
+
+        # Callers may mutate the returned list without affecting the manifest
+        first.append("models.other:Other")
+        assert manifest.list_all_entrypoints() == first[:3]
+
+        manifest.models["models.seir:SEIR"] = ModelEntry(
+            entrypoint="models.seir:SEIR",
+            path="models/seir.py",
+            class_name="SEIR",
+        )
+        assert manifest.list_all_entrypoints() == [
+            "models.seir:SEIR", "models.sir:SIR", "models.sir:SIR/a", "models.sir:SIR/b"
+        ]
@@ -12,15 +12,38 @@ from modelops_contracts import (
     WireFunction,
     SimTask,
     SimReturn,
+    TableArtifact,
     EntryPointId,
-    UniqueParameterSet,
 )
 
 
+class SimpleFuture:
+    """Already-completed future shared by the mock services."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value):
+        self._value = value
+
+    def result(self, timeout: Optional[float] = None):
+        return self._value
+
+    def done(self) -> bool:
+        return True
+
+    def cancel(self) -> bool:
+        return False
+
+    def exception(self) -> Optional[Exception]:
+        return None
+
+
 def test_future_protocol():
     """Test that Future protocol can be implemented."""
     
     class MockFuture:
+        __slots__ = ("_value", "_exception")
+
         def __init__(self, value):
             self._value = value
             self._exception = None
@@ -47,60 +70,44 @@ def test_future_protocol():
     assert future.exception() is None
 
 
-def test_simulation_service_protocol():
+def test_simulation_service_protocol(sample_task, inline_artifact):
     """Test that SimulationService protocol can be implemented."""
     
     class MockSimulationService:
+        def _run(self, task: SimTask) -> SimReturn:
+            return SimReturn(
+                task_id="test-task-id",
+                outputs={"test": inline_artifact}
+            )
+
         def submit(self, task: SimTask) -> Future[SimReturn]:
-            from modelops_contracts import TableArtifact
-            class SimpleFuture:
-                def result(self, timeout=None):
-                    return SimReturn(
-                        task_id="test-task-id",
-                        outputs={"test": TableArtifact(
-                    size=4,
-                    inline=b"data",
-                    checksum="a" * 64  # Valid 64-char hex
-                )}
-                    )
-                def done(self): return True
-                def cancel(self): return False
-                def exception(self): return None
-            return SimpleFuture()
+            return SimpleFuture(self._run(task))
         
         def gather(self, futures: List[Future[SimReturn]]) -> List[SimReturn]:
             return [f.result() for f in futures]
         
         def submit_batch(self, tasks: List[SimTask]) -> List[Future[SimReturn]]:
-            return [self.submit(t) for t in tasks]
+            run = self._run
+            return [SimpleFuture(run(t)) for t in tasks]
     
     # Should be a valid SimulationService implementation
     service: SimulationService = MockSimulationService()
     
-    task = SimTask(
-        bundle_ref="sha256:" + "a" * 64,
-        entrypoint="test.Model/baseline",
-        params=UniqueParameterSet.from_dict({"x": 1}),
-        seed=42
-    )
-    
-    future = service.submit(task)
+    future = service.submit(sample_task)
     assert future.result().task_id == "test-task-id"
 
+    futures = service.submit_batch([sample_task, sample_task])
+    assert [r.task_id for r in service.gather(futures)] == ["test-task-id"] * 2
 
-def test_execution_environment_protocol():
+
+def test_execution_environment_protocol(sample_task, inline_artifact):
     """Test that ExecutionEnvironment protocol can be implemented."""
     
     class MockExecutionEnvironment:
         def run(self, task: SimTask) -> SimReturn:
-            from modelops_contracts import TableArtifact
             return SimReturn(
                 task_id="test-env-task-id",
-                outputs={"test": TableArtifact(
-                    size=4,
-                    inline=b"data",
-                    checksum="a" * 64  # Valid 64-char hex
-                )}
+                outputs={"test": inline_artifact}
             )
         
         def health_check(self) -> Dict[str, Any]:
@@ -112,14 +119,7 @@ def test_execution_environment_protocol():
     # Should be a valid ExecutionEnvironment implementation
     env: ExecutionEnvironment = MockExecutionEnvironment()
     
-    task = SimTask(
-        bundle_ref="sha256:" + "a" * 64,
-        entrypoint="test.Model/baseline",
-        params=UniqueParameterSet.from_dict({"x": 1}),
-        seed=42
-    )
-    
-    result = env.run(task)
+    result = env.run(sample_task)
     assert result.task_id == "test-env-task-id"
     
     health = env.health_check()
@@ -152,6 +152,8 @@ def test_cas_protocol():
     """Test that CAS protocol can be implemented."""
     
     class MockCAS:
+        __slots__ = ("_store",)
+
         def __init__(self):
             self._store = {}
         
@@ -210,7 +212,6 @@ def test_wire_function_protocol():
 
 def test_protocol_runtime_checkability():
     """Test that protocols can be checked at runtime."""
-    from modelops_contracts import TableArtifact
     
     # Our protocols should work with isinstance checks if needed
     class ConcreteEnv:
@@ -2,7 +2,6 @@
 
 import tempfile
 from pathlib import Path
-import yaml
 import pytest
 
 from modelops_contracts import (
@@ -55,31 +54,6 @@ class TestModelEntry:
         assert entry.model_digest == test_digest
         assert len(entry.model_digest) == 64
 
-    def test_model_to_from_dict(self, tmp_path):
-        """Test serialization/deserialization."""
-        model_file = tmp_path / "model.py"
-        model_file.write_text("class Model: pass")
-
-        original = ModelEntry(
-            entrypoint="model:TestModel",
-            path=model_file,
-            class_name="TestModel",
-            outputs=["output1"],
-            data=[tmp_path / "data.csv"],
-            model_digest="test_digest_123"
-        )
-
-        # Serialize
-        data = original.to_dict()
-        assert data["class_name"] == "TestModel"
-        assert data["model_digest"] == "test_digest_123"
-
-        # Deserialize
-        restored = ModelEntry.from_dict(data)
-        assert restored.class_name == original.class_name
-        assert restored.path == original.path
-        assert restored.model_digest == original.model_digest
-
 
 class TestTargetEntry:
     """Test target registry entries."""
@@ -102,21 +76,6 @@ class TestTargetEntry:
         assert entry.model_output == "prevalence"
         assert entry.observation == obs_file
 
-    def test_target_to_from_dict(self, tmp_path):
-        """Test target serialization."""
-        entry = TargetEntry(
-            path=tmp_path / "target.py",
-            model_output="prevalence",
-            observation=tmp_path / "obs.csv",
-            target_digest="digest_456"
-        )
-
-        data = entry.to_dict()
-        restored = TargetEntry.from_dict(data)
-
-        assert restored.model_output == entry.model_output
-        assert restored.target_digest == entry.target_digest
-
 
 class TestBundleRegistry:
     """Test the complete bundle registry."""
@@ -185,49 +144,6 @@ class TestBundleRegistry:
         assert "bad_model" in errors[0]
         assert "not found" in errors[0]
 
-    def test_save_load_registry(self, tmp_path):
-        """Test saving and loading registry."""
-        registry = BundleRegistry()
-
-        # Create test files
-        model_file = tmp_path / "model.py"
-        model_file.write_text("class M: pass")
-
-        target_file = tmp_path / "target.py"
-        target_file.write_text("def t(): pass")
-
-        obs_file = tmp_path / "obs.csv"
-        obs_file.write_text("1,2,3")
-
-        # Add entries
-        registry.add_model(
-            model_id="model1",
-            path=model_file,
-            class_name="M",
-            outputs=["out1"]
-        )
-
-        registry.add_target(
-            target_id="target1",
-            path=target_file,
-            model_output="out1",
-            observation=obs_file
-        )
-
-        # Save
-        registry_file = tmp_path / "registry.yaml"
-        registry.save(registry_file)
-
-        assert registry_file.exists()
-
-        # Load
-        loaded = BundleRegistry.load(registry_file)
-
-        assert "model1" in loaded.models
-        assert "target1" in loaded.targets
-        assert loaded.models["model1"].class_name == "M"
-        assert loaded.targets["target1"].model_output == "out1"
-
     def test_get_all_dependencies(self, tmp_path):
         """Test getting all dependencies from registry."""
         registry = BundleRegistry()
@@ -276,32 +192,6 @@ class TestBundleRegistry:
         assert obs_file in deps
         assert len(deps) == 5
 
-    def test_registry_yaml_format(self, tmp_path):
-        """Test YAML format of saved registry."""
-        registry = BundleRegistry()
-
-        model_file = tmp_path / "m.py"
-        model_file.write_text("model")
-
-        registry.add_model(
-            model_id="test",
-            path=model_file,
-            class_name="TestModel",
-            data=[tmp_path / "data.csv"]
-        )
-
-        registry_file = tmp_path / "registry.yaml"
-        registry.save(registry_file)
-
-        # Check YAML content
-        with open(registry_file) as f:
-            data = yaml.safe_load(f)
-
-        assert data["version"] == "1.0"
-        assert "models" in data
-        assert "test" in data["models"]
-        assert data["models"]["test"]["class_name"] == "TestModel"
-
 
 class TestDiscoverModelClasses:
     """Test the AST-based model discovery function."""
@@ -1,9 +1,17 @@
 """Tests for simulation task specification."""
 
+import re
+from dataclasses import asdict, dataclass, fields, replace
+from types import MappingProxyType
+
 import pytest
 from modelops_contracts import (
     SimTask,
     UniqueParameterSet,
+    ReplicateSet,
+    AggregationTask,
+    SimReturn,
+    TableArtifact,
     ContractViolationError,
 )
 
@@ -12,6 +20,15 @@ TEST_BUNDLE_1 = "sha256:" + "a" * 64
 TEST_BUNDLE_2 = "sha256:" + "b" * 64
 TEST_BUNDLE_3 = "sha256:" + "c" * 64
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_MSG_EMPTY_BUNDLE_REF = re.compile("bundle_ref must be non-empty")
+_MSG_BUNDLE_DIGEST = re.compile("bundle_ref must be a digest")
+_MSG_EMPTY_ENTRYPOINT = re.compile("entrypoint must be non-empty")
+_MSG_ENTRYPOINT_FORMAT = re.compile("Invalid entrypoint format")
+_MSG_PARAMS_TYPE = re.compile("params must be UniqueParameterSet")
+_MSG_SEED_TYPE = re.compile("seed must be int")
+_MSG_SEED_RANGE = re.compile("seed .* out of uint64 range")
+
 
 def test_sim_task_creation():
     """Test basic SimTask creation."""
@@ -53,98 +70,55 @@ def test_sim_task_with_optional_fields():
     assert task.outputs == ("gdp", "population")  # Sorted alphabetically
 
 
-def test_sim_task_immutability():
+def test_sim_task_immutability(sample_task):
     """Test that SimTask is properly frozen."""
-    params = UniqueParameterSet(
-        param_id="ghi789",
-        params={"beta": 2.0}
-    )
-    
-    task = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-        entrypoint="app.Main/baseline",
-        params=params,
-        seed=99
-    )
-    
     # Should not be able to modify attributes
     with pytest.raises(AttributeError):
-        task.seed = 100
+        sample_task.seed = 100
     
     with pytest.raises(AttributeError):
-        task.bundle_ref = "sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
-
-
-
-
-def test_sim_task_validation_errors():
+        sample_task.bundle_ref = TEST_BUNDLE_2
+
+
+
+
+_VALIDATION_PARAMS = UniqueParameterSet(param_id="mno345", params={"delta": 1.5})
+
+
+@pytest.mark.parametrize(
+    "overrides, match",
+    [
+        ({"bundle_ref": ""}, _MSG_EMPTY_BUNDLE_REF),
+        ({"entrypoint": ""}, _MSG_EMPTY_ENTRYPOINT),
+        ({"entrypoint": "not:valid:format"}, _MSG_ENTRYPOINT_FORMAT),
+        # Not a UniqueParameterSet
+        ({"params": {"raw": "dict"}}, _MSG_PARAMS_TYPE),
+        # String instead of int
+        ({"seed": "42"}, _MSG_SEED_TYPE),
+        ({"seed": -1}, _MSG_SEED_RANGE),
+        ({"seed": 2**64}, _MSG_SEED_RANGE),  # Too large
+    ],
+    ids=[
+        "empty-bundle-ref",
+        "empty-entrypoint",
+        "bad-entrypoint",
+        "params-type",
+        "seed-type",
+        "seed-negative",
+        "seed-too-large",
+    ],
+)
+def test_sim_task_validation_errors(overrides, match):
     """Test validation of required fields."""
-    params = UniqueParameterSet(
-        param_id="mno345",
-        params={"delta": 1.5}
-    )
-    
-    # Empty bundle_ref
-    with pytest.raises(ContractViolationError, match="bundle_ref must be non-empty"):
-        SimTask(
-            bundle_ref="",
-            entrypoint="main.Run/baseline",
-            params=params,
-            seed=42
-        )
-    
-    # Empty entrypoint
-    with pytest.raises(ContractViolationError, match="entrypoint must be non-empty"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="",
-            params=params,
-            seed=42
-        )
-    
-    # Invalid entrypoint format
-    with pytest.raises(ContractViolationError, match="Invalid entrypoint format"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="not:valid:format",
-            params=params,
-            seed=42
-        )
-    
-    # Wrong type for params
-    with pytest.raises(ContractViolationError, match="params must be UniqueParameterSet"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="main.Run/baseline",
-            params={"raw": "dict"},  # Not a UniqueParameterSet
-            seed=42
-        )
-    
-    # Wrong type for seed
-    with pytest.raises(ContractViolationError, match="seed must be int"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="main.Run/baseline",
-            params=params,
-            seed="42"  # String instead of int
-        )
-    
-    # Seed out of range
-    with pytest.raises(ContractViolationError, match="seed .* out of uint64 range"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="main.Run/baseline",
-            params=params,
-            seed=-1
-        )
-    
-    with pytest.raises(ContractViolationError, match="seed .* out of uint64 range"):
-        SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            entrypoint="main.Run/baseline",
-            params=params,
-            seed=2**64  # Too large
-        )
+    kwargs = {
+        "bundle_ref": TEST_BUNDLE_1,
+        "entrypoint": "main.Run/baseline",
+        "params": _VALIDATION_PARAMS,
+        "seed": 42,
+        **overrides,
+    }
+    with pytest.raises(ContractViolationError, match=match):
+        SimTask(**kwargs)
 
 
 def test_sim_task_outputs_conversion():
@@ -156,7 +130,7 @@ def test_sim_task_outputs_conversion():
     
     # With list
     task = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="sim.Run/baseline",
         params=params,
         seed=777,
@@ -168,7 +142,7 @@ def test_sim_task_outputs_conversion():
     
     # With tuple (should remain tuple)
     task2 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="sim.Run/baseline",  # Fixed to match bundle_ref
         params=params,
         seed=888,
@@ -187,7 +161,7 @@ def test_sim_task_id_generation():
     )
     
     task1 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="same.Function/base",
         params=params,
         seed=100,
@@ -196,7 +170,7 @@ def test_sim_task_id_generation():
     
     # Same inputs should give same ID
     task2 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="same.Function/base",
         params=params,
         seed=100,
@@ -207,7 +181,7 @@ def test_sim_task_id_generation():
     
     # Different seed should give different ID
     task3 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="same.Function/base",
         params=params,
         seed=101,  # Different seed
@@ -230,25 +204,20 @@ def test_sim_task_equality():
     )
     
     task1 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="app.Start/baseline",
         params=params,
         seed=2048
     )
     
     task2 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         entrypoint="app.Start/baseline",
         params=params,
         seed=2048
     )
     
-    task3 = SimTask(
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-        entrypoint="app.Start/baseline",
-        params=params,
-        seed=2049  # Different seed
-    )
+    task3 = replace(task1, seed=2049)  # Different seed
 
     # Same values should be equal
     assert task1 == task2
@@ -262,12 +231,12 @@ def test_from_components_basic():
     task = SimTask.from_components(
         import_path="my_model.simulations.SEIR",
         scenario="baseline",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"R0": 2.5, "incubation_days": 5},
         seed=42
     )
     
-    assert task.bundle_ref == "sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+    assert task.bundle_ref == TEST_BUNDLE_1
     assert str(task.entrypoint) == "my_model.simulations.SEIR/baseline"
     assert task.params.params["R0"] == 2.5
     assert task.params.params["incubation_days"] == 5
@@ -282,7 +251,7 @@ def test_from_components_with_outputs():
     task = SimTask.from_components(
         import_path="covid.models.Main",
         scenario="lockdown",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"beta": 0.5},
         seed=100,
         outputs=["hospitalizations", "deaths", "infections"]  # Unsorted
@@ -300,7 +269,7 @@ def test_from_components_with_config_env():
     task = SimTask.from_components(
         import_path="sim.Engine",
         scenario="test",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"x": 1.0},
         seed=777,
         config=config,
@@ -311,7 +280,6 @@ def test_from_components_with_config_env():
     assert task.env is not None
     
     # Should be frozen as MappingProxyType
-    from types import MappingProxyType
     assert isinstance(task.config, MappingProxyType)
     assert isinstance(task.env, MappingProxyType)
     
@@ -333,7 +301,7 @@ def test_from_components_generates_param_id():
     task = SimTask.from_components(
         import_path="test.Model",
         scenario="baseline",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params=params,
         seed=42
     )
@@ -346,7 +314,7 @@ def test_from_components_generates_param_id():
     task2 = SimTask.from_components(
         import_path="test.Model",
         scenario="baseline",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params=params,
         seed=42
     )
@@ -358,7 +326,7 @@ def test_from_components_sim_root_includes_config():
     task_without_config = SimTask.from_components(
         import_path="model.Sim",
         scenario="base",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"p": 1},
         seed=10
     )
@@ -366,7 +334,7 @@ def test_from_components_sim_root_includes_config():
     task_with_config = SimTask.from_components(
         import_path="model.Sim",
         scenario="base",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"p": 1},
         seed=10,
         config={"option": "value"}
@@ -379,16 +347,112 @@ def test_from_components_sim_root_includes_config():
     # task_id() was removed
 
 
+def test_from_components_batch():
+    """Test batch factory matches from_components item by item."""
+    items = [
+        {"params": {"x": float(i)}, "seed": i, "outputs": ["b", "a"]}
+        for i in range(100)
+    ]
+    items.append({"params": {"x": 0.0}, "seed": 7, "config": {"option": "value"}})
+
+    tasks = SimTask.from_components_batch(
+        import_path="test.Model",
+        scenario="baseline",
+        bundle_ref=TEST_BUNDLE_1,
+        items=items,
+    )
+
+    expected = [
+        SimTask.from_components(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref=TEST_BUNDLE_1,
+            **item,
+        )
+        for item in items
+    ]
+    assert tasks == expected
+    assert tasks[0].outputs == ("a", "b")
+    # Shared strings are validated and stored once
+    assert all(t.bundle_ref is tasks[0].bundle_ref for t in tasks)
+    assert all(t.entrypoint is tasks[0].entrypoint for t in tasks)
+
+
+def test_from_components_batch_validation():
+    """Test batch factory still validates shared and per-item fields."""
+    with pytest.raises(ContractViolationError, match=_MSG_BUNDLE_DIGEST):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref="not-a-digest",
+            items=[{"params": {"x": 1}, "seed": 1}],
+        )
+
+    # Seeds of later items are still range-checked
+    with pytest.raises(ContractViolationError, match=_MSG_SEED_RANGE):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref=TEST_BUNDLE_1,
+            items=[{"params": {"x": 1}, "seed": 1}, {"params": {"x": 2}, "seed": -1}],
+        )
+
+    assert SimTask.from_components_batch(
+        import_path="test.Model",
+        scenario="baseline",
+        bundle_ref=TEST_BUNDLE_1,
+        items=[],
+    ) == []
+    # The shared bundle_ref is checked even when there are no items
+    with pytest.raises(ContractViolationError, match=_MSG_BUNDLE_DIGEST):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref="not-a-digest",
+            items=[],
+        )
+    with pytest.raises(ContractViolationError, match=_MSG_EMPTY_BUNDLE_REF):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref="",
+            items=[],
+        )
+
+    # Mistyped or missing item keys are rejected rather than ignored
+    with pytest.raises(ContractViolationError, match="Unknown batch item keys: output"):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref=TEST_BUNDLE_1,
+            items=[{"params": {"x": 1}, "seed": 1, "output": ["a"]}],
+        )
+    with pytest.raises(ContractViolationError, match="Missing batch item keys: seed"):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref=TEST_BUNDLE_1,
+            items=[{"params": {"x": 1}}],
+        )
+    with pytest.raises(ContractViolationError, match="Missing batch item keys: params, seed"):
+        SimTask.from_components_batch(
+            import_path="test.Model",
+            scenario="baseline",
+            bundle_ref=TEST_BUNDLE_1,
+            items=[MappingProxyType({})],
+        )
+
+
 def test_simtask_direct_constructor():
     """Test creating SimTask with direct constructor."""
     task = SimTask(
         entrypoint="my_model.simulations.SEIR/baseline",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params=UniqueParameterSet.from_dict({"R0": 2.5, "incubation_days": 5}),
         seed=42
     )
     
-    assert task.bundle_ref == "sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+    assert task.bundle_ref == TEST_BUNDLE_1
     assert str(task.entrypoint) == "my_model.simulations.SEIR/baseline"
     assert task.params.params["R0"] == 2.5
     assert task.params.params["incubation_days"] == 5
@@ -401,9 +465,9 @@ def test_simtask_direct_constructor():
 def test_simtask_validation_in_post_init():
     """Test that __post_init__ validates fields."""
     # Invalid entrypoint format
-    with pytest.raises(ContractViolationError, match="Invalid entrypoint format"):
+    with pytest.raises(ContractViolationError, match=_MSG_ENTRYPOINT_FORMAT):
         SimTask(
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+            bundle_ref=TEST_BUNDLE_1,
             entrypoint="invalid-entrypoint",  # Bad format!
             params=UniqueParameterSet.from_dict({"p": 1}),
             seed=42
@@ -416,7 +480,7 @@ def test_from_components_and_direct_constructor():
     task1 = SimTask.from_components(
         import_path="roundtrip.test.Model",
         scenario="baseline",
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params={"alpha": 0.5, "beta": 1.0},
         seed=100,
         outputs=["metric1", "metric2"],
@@ -429,7 +493,7 @@ def test_from_components_and_direct_constructor():
     # Create again with direct constructor
     task2 = SimTask(
         entrypoint=entrypoint_str,
-        bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        bundle_ref=TEST_BUNDLE_1,
         params=UniqueParameterSet.from_dict({"alpha": 0.5, "beta": 1.0}),
         seed=100,
         outputs=["metric1", "metric2"],
@@ -449,57 +513,285 @@ def test_from_components_and_direct_constructor():
     # task_id() was removed
 
 
-def test_seed_uint64_bounds():
-    """Test that seed is validated to be within uint64 bounds."""
-    # Valid seeds
-    for seed in [0, 1, 42, 2**32, 2**64 - 1]:
-        task = SimTask.from_components(
+@pytest.mark.parametrize("seed", [0, 1, 42, 2**32, 2**64 - 1])
+def test_seed_uint64_bounds(seed):
+    """Test that seeds within uint64 bounds are accepted."""
+    task = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={},
+        seed=seed
+    )
+    assert task.seed == seed
+
+
+@pytest.mark.parametrize("seed", [-1, -100, 2**64, 2**64 + 1])
+def test_seed_uint64_out_of_bounds(seed):
+    """Test that seeds outside uint64 bounds are rejected."""
+    with pytest.raises(ContractViolationError, match=_MSG_SEED_RANGE):
+        SimTask.from_components(
             import_path="test.Model",
             scenario="test",
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+            bundle_ref=TEST_BUNDLE_1,
             params={},
             seed=seed
         )
-        assert task.seed == seed
-    
-    # Invalid seeds
-    for seed in [-1, -100, 2**64, 2**64 + 1]:
-        with pytest.raises(ContractViolationError, match="seed .* out of uint64 range"):
-            SimTask.from_components(
-                import_path="test.Model",
-                scenario="test",
-                bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-                params={},
-                seed=seed
-            )
 
 
-def test_outputs_always_sorted():
-    """Test that outputs are always sorted regardless of input order."""
-    # Test different orderings all produce same result
-    orderings = [
+@pytest.mark.parametrize(
+    "outputs",
+    [
         ["zebra", "apple", "mango"],
         ["mango", "zebra", "apple"],
         ["apple", "mango", "zebra"],
+    ],
+)
+def test_outputs_always_sorted(outputs):
+    """Test that outputs are always sorted regardless of input order."""
+    task = SimTask.from_components(
+        import_path="test.Sort",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=10,
+        outputs=outputs
+    )
+    assert task.outputs == ("apple", "mango", "zebra")
+
+
+def test_sim_task_interns_shared_strings():
+    """Test that bundle_ref and entrypoint are shared across tasks."""
+    params = UniqueParameterSet.from_dict({"x": 1})
+    # Build strings at runtime so they are distinct objects before interning
+    bundle_ref = "".join(["sha256:", "a" * 64])
+    entrypoint = "".join(["sim.Run", "/baseline"])
+
+    task1 = SimTask(bundle_ref=bundle_ref, entrypoint=entrypoint, params=params, seed=1)
+    task2 = SimTask(
+        bundle_ref="".join(["sha256:", "a" * 64]),
+        entrypoint="".join(["sim.Run", "/baseline"]),
+        params=params,
+        seed=2,
+    )
+
+    assert task1.bundle_ref is task2.bundle_ref
+    assert task1.entrypoint is task2.entrypoint
+
+    # str subclasses are accepted and stored as plain interned str
+    class BundleRef(str):
+        pass
+
+    task3 = SimTask(bundle_ref=BundleRef(bundle_ref), entrypoint=entrypoint, params=params, seed=3)
+    assert type(task3.bundle_ref) is str
+    assert task3.bundle_ref is task1.bundle_ref
+
+
+def test_sim_task_uses_slots():
+    """Test that SimTask instances carry no per-instance __dict__."""
+    task = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=1,
+    )
+    assert not hasattr(task, "__dict__")
+    assert not hasattr(task.params, "__dict__")
+
+
+def test_aggregation_id_cached():
+    """Test that aggregation_id is stable and computed once per task."""
+    artifact = TableArtifact(size=4, inline=b"data", checksum="a" * 64)
+    sim_returns = [
+        SimReturn(task_id=f"task-{i}", outputs={"out": artifact}) for i in range(3)
     ]
-    
-    tasks = []
-    for outputs in orderings:
-        task = SimTask.from_components(
-            import_path="test.Sort",
-            scenario="test",
-            bundle_ref="sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-            params={"x": 1},
-            seed=10,
-            outputs=outputs
-        )
-        tasks.append(task)
-    
-    # All should have same sorted outputs
-    expected = ("apple", "mango", "zebra")
+    agg = AggregationTask(
+        bundle_ref=TEST_BUNDLE_1,
+        target_entrypoint="targets.covid:deaths",
+        sim_returns=sim_returns,
+    )
+
+    agg_id = agg.aggregation_id()
+    assert len(agg_id) == 16
+    # Pinned: aggregation IDs are exchanged between services and must not drift
+    assert agg_id == "66a2a1a621b9bd17"
+    assert agg.aggregation_id() is agg_id
+
+    # Order of results doesn't matter; the cache doesn't affect equality
+    agg2 = AggregationTask(
+        bundle_ref=TEST_BUNDLE_1,
+        target_entrypoint="targets.covid:deaths",
+        sim_returns=list(reversed(sim_returns)),
+    )
+    assert agg2.aggregation_id() == agg_id
+
+    # Identity follows aggregation_id, so tasks are equal and hashable
+    assert agg == agg2
+    assert len({agg, agg2}) == 1
+    agg3 = AggregationTask(
+        bundle_ref=TEST_BUNDLE_1,
+        target_entrypoint="targets.covid:deaths",
+        sim_returns=sim_returns[:2],
+    )
+    assert agg != agg3
+
+
+def test_aggregation_task_snapshots_sim_returns():
+    """Test that the cached aggregation_id can't drift from sim_returns."""
+    artifact = TableArtifact(size=4, inline=b"data", checksum="a" * 64)
+    sim_returns = [
+        SimReturn(task_id=f"task-{i}", outputs={"out": artifact}) for i in range(3)
+    ]
+    agg = AggregationTask(
+        bundle_ref=TEST_BUNDLE_1,
+        target_entrypoint="targets.covid:deaths",
+        sim_returns=sim_returns,
+    )
+    agg_id = agg.aggregation_id()
+    sim_returns.pop()
+    assert len(agg.sim_returns) == 3
+    assert isinstance(agg.sim_returns, tuple)
+    assert agg.aggregation_id() == agg_id
+
+    # The memo is not a dataclass field
+    assert [f.name for f in fields(agg)] == [
+        "bundle_ref", "target_entrypoint", "sim_returns", "target_data"
+    ]
+    assert "_aggregation_id" not in asdict(agg)
+
+
+def test_replicate_set_tasks():
+    """Test that replicates share fields and differ only by seed."""
+    base = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=100,
+        outputs=["b", "a"],
+        config={"option": "value"},
+    )
+    tasks = ReplicateSet(base_task=base, n_replicates=3, seed_offset=10).tasks()
+
+    assert [t.seed for t in tasks] == [110, 111, 112]
+    assert list(ReplicateSet(base_task=base, n_replicates=3, seed_offset=10).seeds) == [110, 111, 112]
     for task in tasks:
-        assert task.outputs == expected
-    
-    # And same task_id (since outputs are deterministic)
-    # task_id() was removed
-    pass  # All same
\ No newline at end of file
+        assert task == SimTask(
+            bundle_ref=base.bundle_ref,
+            entrypoint=base.entrypoint,
+            params=base.params,
+            seed=task.seed,
+            outputs=base.outputs,
+            config=base.config,
+        )
+        assert task.params is base.params
+        assert task.config is base.config
+
+    # Replicate seeds are still range-checked
+    near_max = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={},
+        seed=2**64 - 1,
+    )
+    with pytest.raises(ContractViolationError, match=_MSG_SEED_RANGE):
+        ReplicateSet(base_task=near_max, n_replicates=2).tasks()
+    with pytest.raises(ContractViolationError, match=_MSG_SEED_TYPE):
+        base._with_seed(1.5)
+
+    with pytest.raises(ContractViolationError, match=_MSG_SEED_TYPE):
+        TaggedTask(
+            bundle_ref=base.bundle_ref, entrypoint=base.entrypoint, params=base.params, seed=1
+        )._with_seed(1.5)
+
+
+@dataclass(frozen=True, slots=True)
+class TaggedTask(SimTask):
+    """SimTask subclass with an extra field, as downstream code may define."""
+    tag: str = "default"
+
+
+def test_replicate_set_keeps_subclass_fields():
+    """Test that replicates of a subclass keep its class and extra fields."""
+    tagged = TaggedTask(
+        bundle_ref=TEST_BUNDLE_1,
+        entrypoint="test.Model/test",
+        params=UniqueParameterSet.from_dict({"x": 1}),
+        seed=1,
+        tag="custom",
+    )
+    tasks = ReplicateSet(base_task=tagged, n_replicates=2).tasks()
+
+    assert [type(t) for t in tasks] == [TaggedTask, TaggedTask]
+    assert [t.tag for t in tasks] == ["custom", "custom"]
+    assert tasks[0] == tagged
+    assert tasks[1] == replace(tagged, seed=2)
+    assert "custom" in repr(tasks[1])
+
+
+def test_from_components_subclass_defaults():
+    """Test that from_components applies a subclass's field defaults."""
+    task = TaggedTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=1,
+    )
+    assert type(task) is TaggedTask
+    assert task.tag == "default"
+    assert TaggedTask.from_components_batch(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        items=[{"params": {"x": 1}, "seed": 1}],
+    ) == [task]
+    assert task == TaggedTask(
+        bundle_ref=TEST_BUNDLE_1,
+        entrypoint="test.Model/test",
+        params=UniqueParameterSet.from_dict({"x": 1}),
+        seed=1,
+    )
+
+
+def test_sim_task_copies_config():
+    """Test that config is copied, whether passed as a dict or a proxy."""
+    config = {"iterations": 1000}
+    task1 = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=1,
+        config=config,
+    )
+
+    # Later changes to the caller's dict don't leak into the task
+    config["iterations"] = 1
+    assert task1.config["iterations"] == 1000
+
+    # A caller's proxy is a live view of their dict, so it is copied too
+    env = {"THREADS": "4"}
+    task2 = SimTask.from_components(
+        import_path="test.Model",
+        scenario="test",
+        bundle_ref=TEST_BUNDLE_1,
+        params={"x": 1},
+        seed=2,
+        config=MappingProxyType(config),
+        env=MappingProxyType(env),
+    )
+    config["iterations"] = 2
+    env["THREADS"] = "8"
+    assert task2.config["iterations"] == 1
+    assert task2.env["THREADS"] == "4"
+
+
+def test_unique_parameter_set_copies_proxy_params():
+    """Test that a proxy over the caller's dict can't change params."""
+    params = {"x": 1.0}
+    ups = UniqueParameterSet(params=MappingProxyType(params), param_id="abc123")
+    params["x"] = 2.0
+    assert ups.params["x"] == 1.0
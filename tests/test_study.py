@@ -0,0 +1,61 @@
+"""Tests for study types."""
+
+import pytest
+from modelops_contracts import SimTask, SimulationStudy
+
+TEST_BUNDLE = "sha256:" + "a" * 64
+
+
+def _study(n_replicates):
+    return SimulationStudy(
+        model="models.seir",
+        scenario="baseline",
+        parameter_sets=[{"beta": 0.5, "gamma": 0.1}, {"beta": 0.7, "gamma": 0.1}],
+        sampling_method="grid",
+        n_replicates=n_replicates,
+        outputs=["prevalence", "incidence"],
+    )
+
+
+def test_to_simjob_replicates():
+    """Test that to_simjob produces stable seeds and param_ids per replicate."""
+    job = _study(3).to_simjob(TEST_BUNDLE, job_id="job-1")
+
+    # Pinned: replicate seeds must not drift between versions
+    assert [(t.params.param_id[:8], t.seed) for t in job.tasks] == [
+        ("4dcc7ab1", 3339843738),
+        ("4dcc7ab1", 104683033),
+        ("4dcc7ab1", 2701143075),
+        ("ba2bb240", 1613696464),
+        ("ba2bb240", 2718133907),
+        ("ba2bb240", 2291000921),
+    ]
+    for task in job.tasks:
+        assert task.bundle_ref == TEST_BUNDLE
+        assert task.entrypoint == "models.seir/baseline"
+        assert task.outputs == ("incidence", "prevalence")
+
+    # Replicates match tasks built independently with from_components
+    replicate = job.tasks[1]
+    assert replicate == SimTask.from_components(
+        import_path="models.seir",
+        scenario="baseline",
+        bundle_ref=TEST_BUNDLE,
+        params={"beta": 0.5, "gamma": 0.1},
+        seed=104683033,
+        outputs=["prevalence", "incidence"],
+    )
+    assert len(job.get_task_groups()) == 2
+    assert job.metadata["n_replicates"] == 3
+
+
+def test_to_simjob_zero_replicates():
+    """Test that a study without replicates produces no tasks."""
+    job = _study(0).to_simjob(TEST_BUNDLE, job_id="job-1")
+    assert job.tasks == []
+
+
+def test_to_simjob_invalid_bundle_ref():
+    """Test that to_simjob rejects non-digest bundle references."""
+    with pytest.raises(ValueError, match="bundle_ref must be sha256"):
+        _study(1).to_simjob("not-a-digest")